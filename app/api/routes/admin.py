@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from pydantic import BaseModel
 from typing import Optional
 import uuid
 
+from app.db.base import safe_list
 from app.db.session import get_db
 from app.schemas.auth import UserResponse
 from app.api.deps import require_admin
@@ -42,16 +43,15 @@ def create_user(payload: CreateUserRequest, db: Session = Depends(get_db)):
 
 @router.get("/users", dependencies=[Depends(require_admin)])
 def list_users(db: Session = Depends(get_db)):
-    users = db.query(User).all()
+    users = safe_list(db.query(User).options(selectinload(User.roles))).all()
     result = []
     for u in users:
-        roles = db.query(UserRole).filter(UserRole.user_id == u.id).all()
         result.append({
             "id": u.id,
             "email": u.email,
             "full_name": u.full_name,
             "is_active": u.is_active,
-            "role_ids": [r.role_id for r in roles],
+            "role_ids": [r.role_id for r in u.roles],
         })
     return result
 
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from app.api.deps import get_current_user
 from app.core.config import settings
-from app.services.storage import ensure_bucket_exists, upload_stream
+from app.schemas.file import PresignRequest, PresignResponse
+from app.services.storage import ensure_bucket_exists, presign_put, upload_stream, upload_stream_multipart
 
 router = APIRouter(prefix="/files", tags=["files"])
 
+# Час життя presigned URL, секунди
+PRESIGN_EXPIRES_IN = 3600
+
 
 @router.post("/ensure-bucket")
 def ensure_bucket():
@@ -20,9 +26,11 @@ async def upload_file(file: UploadFile = File(...)):
     Простой upload: FastAPI принимает файл и кладёт в MinIO.
     """
     try:
-        ensure_bucket_exists(settings.s3_bucket)
+        # boto3 синхронний — виносимо в threadpool, щоб не блокувати event loop
+        await run_in_threadpool(ensure_bucket_exists, settings.s3_bucket)
 
-        object_key = upload_stream(
+        object_key = await run_in_threadpool(
+            upload_stream,
             fileobj=file.file,
             original_name=file.filename,
             content_type=file.content_type or "application/octet-stream",
@@ -36,3 +44,54 @@ async def upload_file(file: UploadFile = File(...)):
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/upload-stream")
+async def upload_file_stream(request: Request, filename: str, current_user=Depends(get_current_user)):
+    """
+    Потоковий upload: тіло запиту — сирі байти файлу (не multipart/form-data),
+    ім'я передається в query, тип — у заголовку Content-Type.
+    Байти йдуть у MinIO частинами, минаючи UploadFile і тимчасові файли.
+    """
+    content_type = request.headers.get("content-type") or "application/octet-stream"
+    try:
+        await run_in_threadpool(ensure_bucket_exists, settings.s3_bucket)
+
+        object_key = await upload_stream_multipart(
+            request.stream(),
+            original_name=filename,
+            content_type=content_type,
+        )
+        return {
+            "ok": True,
+            "bucket": settings.s3_bucket,
+            "object_key": object_key,
+            "original_name": filename,
+            "content_type": content_type,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/presign", response_model=PresignResponse)
+def presign_upload(payload: PresignRequest, current_user=Depends(get_current_user)):
+    """
+    Presigned PUT: клієнт вантажить файл напряму в MinIO, минаючи API.
+    Запит на URL має йти з тим самим Content-Type, що вказаний тут.
+    """
+    try:
+        ensure_bucket_exists(settings.s3_bucket)
+        object_key, url = presign_put(
+            original_name=payload.original_name,
+            content_type=payload.content_type,
+            expires=PRESIGN_EXPIRES_IN,
+        )
+        return PresignResponse(
+            url=url,
+            method="PUT",
+            bucket=settings.s3_bucket,
+            object_key=object_key,
+            expires_in=PRESIGN_EXPIRES_IN,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.api.deps import get_current_user, get_user_roles
 from app.services.search_service import search_submissions
-from app.services.submission_service import get_submission
+from app.services.submission_service import get_submissions_by_ids
 import uuid
 
 router = APIRouter(prefix="/search", tags=["search"])
@@ -29,10 +29,7 @@ def search(
 
     # Фільтруємо по ролі — учасник бачить тільки свої
     results = []
-    for submission_id in ids:
-        submission = get_submission(db, uuid.UUID(submission_id))
-        if not submission:
-            continue
+    for submission in get_submissions_by_ids(db, [uuid.UUID(i) for i in ids]):
         if 2 not in role_ids and 3 not in role_ids:
             if str(submission.author_id) != str(current_user.id):
                 continue
@@ -1,17 +1,19 @@
 import uuid
 import io
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
 from app.services.submission_file_service import (
+    spool_upload,
     upload_submission_file,
     get_submission_files,
     get_submission_file,
 )
 from app.services.storage import download_file
-from app.services.validation_service import validate_and_save, get_report
+from app.services.validation_service import validate_in_background, get_report
 from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/submissions/{submission_id}/files", tags=["submission-files"])
@@ -22,18 +24,29 @@ DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessin
 @router.post("/")
 async def upload_file(
     submission_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
     current_user=Depends(get_current_user),
 ):
     try:
-        record, file_bytes = upload_submission_file(
-            db=db,
-            submission_id=submission_id,
-            fileobj=file.file,
-            original_name=file.filename,
-            content_type=file.content_type or "application/octet-stream",
-        )
+        # Файл читаємо один раз: той самий spool іде в MinIO і у валідатор
+        spool, size_bytes, digest = await spool_upload(file)
+        try:
+            record = await run_in_threadpool(
+                upload_submission_file,
+                db=db,
+                submission_id=submission_id,
+                fileobj=spool,
+                original_name=file.filename,
+                content_type=file.content_type or "application/octet-stream",
+                size_bytes=size_bytes,
+            )
+        except BaseException:
+            # Фонова задача не запуститься, тож spool закриваємо тут
+            spool.close()
+            raise
 
         validation = None
         is_docx = (
@@ -41,11 +54,11 @@ async def upload_file(
             or (file.filename or "").endswith(".docx")
         )
         if is_docx:
-            try:
-                val_record = validate_and_save(db, record.id, file_bytes)
-                validation = {"ok": val_record.ok, "issues": val_record.issues}
-            except Exception as val_err:
-                validation = {"ok": None, "error": str(val_err)}
+            # Перевірка йде після відповіді; результат — GET /{file_id}/validation
+            background_tasks.add_task(validate_in_background, session_factory, record.id, spool, digest)
+            validation = {"status": "pending"}
+        else:
+            spool.close()
 
         return {
             "id": record.id,
@@ -13,6 +13,8 @@ class Settings(BaseSettings):
     s3_secret_key: str
     s3_bucket: str
     s3_region: str = "us-east-1"
+    # Адреса MinIO, доступна з браузера (для presigned URL); за замовчуванням s3_endpoint
+    s3_public_endpoint: str | None = None
 
     es_host: str = "http://elasticsearch:9200"
 
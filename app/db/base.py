@@ -1,5 +1,30 @@
-from sqlalchemy.orm import DeclarativeBase
+import os
+import time
+import uuid
+
+from sqlalchemy.orm import DeclarativeBase, raiseload
 
 
 class Base(DeclarativeBase):
     pass
+
+
+def uuid7() -> uuid.UUID:
+    """
+    UUIDv7 (RFC 9562): 48 біт unix-часу в мс + випадкові біти.
+    Ключі зростають у часі, тож вставки йдуть у кінець B-tree індексу.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    value = (ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # variant RFC 4122
+    return uuid.UUID(int=value)
+
+
+def safe_list(query):
+    """
+    Забороняє ліниве завантаження зв'язків у списковому запиті:
+    звернення до зв'язку, не завантаженого явно (selectinload/joinedload),
+    кидає помилку замість тихого N+1.
+    """
+    return query.options(raiseload("*"))
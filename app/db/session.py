@@ -14,3 +14,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_session_factory() -> sessionmaker:
+    # Фонові задачі відкривають власні сесії вже після відповіді — через цю фабрику
+    return SessionLocal
@@ -1,21 +1,30 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, DateTime, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class Conference(Base):
     __tablename__ = "conferences"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     submission_deadline: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    # Колекції вантажимо явно (selectinload) там, де вони потрібні: eager за замовчуванням
+    # тягнув би ланцюжок conference -> groups -> members -> users на кожну заявку
+    submissions: Mapped[list["Submission"]] = relationship(
+        "Submission", back_populates="conference", passive_deletes=True
+    )
+    groups: Mapped[list["ConferenceGroup"]] = relationship(
+        "ConferenceGroup", back_populates="conference", passive_deletes=True
+    )
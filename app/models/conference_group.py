@@ -1,14 +1,15 @@
 import uuid
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
 
 class ConferenceGroup(Base):
     __tablename__ = "conference_groups"
+    __table_args__ = (Index("ix_conference_groups_group_id", "group_id"),)
 
     conference_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -20,3 +21,6 @@ class ConferenceGroup(Base):
         ForeignKey("groups.id", ondelete="CASCADE"),
         primary_key=True,
     )
+
+    conference: Mapped["Conference"] = relationship("Conference", back_populates="groups")
+    group: Mapped["Group"] = relationship("Group", back_populates="conferences")
@@ -3,7 +3,7 @@ from datetime import datetime
 
 from sqlalchemy import DateTime, String, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
@@ -15,3 +15,10 @@ class Group(Base):
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+
+    members: Mapped[list["GroupMember"]] = relationship(
+        "GroupMember", back_populates="group", passive_deletes=True
+    )
+    conferences: Mapped[list["ConferenceGroup"]] = relationship(
+        "ConferenceGroup", back_populates="group", passive_deletes=True
+    )
@@ -1,14 +1,15 @@
 import uuid
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
 
 class GroupMember(Base):
     __tablename__ = "group_members"
+    __table_args__ = (Index("ix_group_members_user_id", "user_id"),)
 
     group_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -20,3 +21,6 @@ class GroupMember(Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         primary_key=True,
     )
+
+    group: Mapped["Group"] = relationship("Group", back_populates="members")
+    user: Mapped["User"] = relationship("User")
@@ -1,17 +1,21 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class Submission(Base):
     __tablename__ = "submissions"
+    __table_args__ = (
+        Index("ix_submissions_author_id", "author_id"),
+        Index("ix_submissions_conference_status", "conference_id", "status"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     conference_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -31,8 +35,10 @@ class Submission(Base):
 
     status: Mapped[str] = mapped_column(String(30), nullable=False, default="draft")
     submitted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     authors: Mapped[list["SubmissionAuthor"]] = relationship(
         "SubmissionAuthor", back_populates="submission", order_by="SubmissionAuthor.order"
-    )
\ No newline at end of file
+    )
+    conference: Mapped["Conference"] = relationship("Conference", back_populates="submissions")
+    author: Mapped["User"] = relationship("User")
\ No newline at end of file
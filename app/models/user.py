@@ -21,4 +21,4 @@ class User(Base):
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
 
-    roles: Mapped[list["UserRole"]] = relationship("UserRole", lazy="joined")
\ No newline at end of file
+    roles: Mapped[list["UserRole"]] = relationship("UserRole", back_populates="user", lazy="joined")
\ No newline at end of file
@@ -1,14 +1,15 @@
 import uuid
 
-from sqlalchemy import ForeignKey, SmallInteger
+from sqlalchemy import ForeignKey, Index, SmallInteger
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
 
 class UserRole(Base):
     __tablename__ = "user_roles"
+    __table_args__ = (Index("ix_user_roles_role_id", "role_id"),)
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -21,3 +22,6 @@ class UserRole(Base):
         ForeignKey("roles.id", ondelete="RESTRICT"),
         primary_key=True,
     )
+
+    user: Mapped["User"] = relationship("User", back_populates="roles")
+    role: Mapped["Role"] = relationship("Role")
@@ -16,9 +16,10 @@ from pathlib import Path
 
 from PyPDF2 import PdfMerger
 from jinja2 import Environment, BaseLoader
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 import weasyprint
 
+from app.db.base import safe_list
 from app.models.submission import Submission
 from app.models.submission_file import SubmissionFile
 from app.models.conference import Conference
@@ -187,6 +188,27 @@ def _make_section_pdf(section_name: str) -> bytes:
     return weasyprint.HTML(string=html).write_pdf()
 
 
+# ---------------------------------------------------------------------------
+# Файли заявок
+# ---------------------------------------------------------------------------
+
+def _latest_docx_files(db: Session, submission_ids: list[uuid.UUID]) -> dict[uuid.UUID, SubmissionFile]:
+    """Останній завантажений .docx для кожної заявки."""
+    files = (
+        safe_list(db.query(SubmissionFile))
+        .filter(
+            SubmissionFile.submission_id.in_(submission_ids),
+            SubmissionFile.original_name.ilike("%.docx"),
+        )
+        .order_by(SubmissionFile.uploaded_at.desc())
+        .all()
+    )
+    latest: dict[uuid.UUID, SubmissionFile] = {}
+    for f in files:
+        latest.setdefault(f.submission_id, f)
+    return latest
+
+
 # ---------------------------------------------------------------------------
 # Головна функція
 # ---------------------------------------------------------------------------
@@ -197,8 +219,7 @@ def generate_collection_pdf(db: Session, conference_id: uuid.UUID) -> bytes:
         raise ValueError("Конференцію не знайдено")
 
     submissions = (
-        db.query(Submission)
-        .options(joinedload(Submission.authors))
+        safe_list(db.query(Submission).options(selectinload(Submission.authors)))
         .filter(
             Submission.conference_id == conference_id,
             Submission.status == "accepted",
@@ -224,6 +245,9 @@ def generate_collection_pdf(db: Session, conference_id: uuid.UUID) -> bytes:
     if "Без секції" in by_section:
         order.append("Без секції")
 
+    # Останній .docx кожної заявки — одним запитом, а не окремим на кожну
+    docx_files = _latest_docx_files(db, [s.id for s in submissions])
+
     merger = PdfMerger()
 
     # Титульна сторінка
@@ -241,16 +265,7 @@ def generate_collection_pdf(db: Session, conference_id: uuid.UUID) -> bytes:
         merger.append(io.BytesIO(_make_section_pdf(section_name)))
 
         for sub in sorted(section_submissions, key=lambda s: (s.submitted_at is None, s.submitted_at)):
-            # Беремо останній завантажений .docx
-            file_record = (
-                db.query(SubmissionFile)
-                .filter(
-                    SubmissionFile.submission_id == sub.id,
-                    SubmissionFile.original_name.ilike("%.docx"),
-                )
-                .order_by(SubmissionFile.uploaded_at.desc())
-                .first()
-            )
+            file_record = docx_files.get(sub.id)
 
             if not file_record:
                 print(f"[collection] немає файлу для '{sub.title}'")
@@ -1,5 +1,7 @@
 import uuid
 from sqlalchemy.orm import Session
+
+from app.db.base import safe_list
 from app.models.conference import Conference
 from app.schemas.conference import ConferenceCreate, ConferenceUpdate
 
@@ -21,7 +23,7 @@ def get_conference(db: Session, conference_id: uuid.UUID) -> Conference | None:
 
 
 def list_conferences(db: Session, is_active: bool | None = None) -> list[Conference]:
-    q = db.query(Conference)
+    q = safe_list(db.query(Conference))
     if is_active is not None:
         q = q.filter(Conference.is_active == is_active)
     return q.all()
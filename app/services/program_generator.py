@@ -8,9 +8,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 import weasyprint
 
+from app.db.base import safe_list
 from app.models.submission import Submission
 from app.models.conference import Conference
 from app.schemas.submission import VALID_SECTIONS
@@ -138,8 +139,7 @@ def generate_program_pdf(db: Session, conference_id: uuid.UUID) -> bytes:
         raise ValueError("Конференція не знайдена")
 
     submissions = (
-        db.query(Submission)
-        .options(joinedload(Submission.authors))
+        safe_list(db.query(Submission).options(selectinload(Submission.authors)))
         .filter(
             Submission.conference_id == conference_id,
             Submission.status == "accepted",
@@ -1,35 +1,91 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import uuid
 from dataclasses import dataclass
-from typing import BinaryIO
+from functools import lru_cache
+from typing import AsyncIterator, BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
 
-
-
-def _get_s3_client():
+# Файли до цього розміру вантажимо одним put_object, без transfer manager.
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+    io_chunksize=1024 * 1024,
+)
+
+# Пул з'єднань під паралельні upload'и (threadpool + transfer manager),
+# щоб не відкривати нове з'єднання/TLS-рукостискання на кожен запит.
+S3_CLIENT_CONFIG = Config(
+    signature_version="s3v4",
+    max_pool_connections=64,
+    retries={"max_attempts": 3, "mode": "standard"},
+    connect_timeout=2,
+    read_timeout=30,
+    tcp_keepalive=True,
+)
+
+# Розмір частини для потокового multipart (S3 вимагає >= 5 MiB, крім останньої).
+STREAM_PART_SIZE = 8 * 1024 * 1024
+
+
+def _build_s3_client(endpoint_url: str):
     return boto3.client(
         "s3",
-        endpoint_url=settings.s3_endpoint,
+        endpoint_url=endpoint_url,
         aws_access_key_id=settings.s3_access_key,
         aws_secret_access_key=settings.s3_secret_key,
         region_name=settings.s3_region,
-        config=Config(signature_version="s3v4"),
+        config=S3_CLIENT_CONFIG,
     )
 
 
+@lru_cache(maxsize=1)
+def _get_s3_client():
+    # boto3-клієнт потокобезпечний, тож один екземпляр на процес
+    # перевикористовується всіма запитами замість збирання нового щоразу.
+    return _build_s3_client(settings.s3_endpoint)
+
+
+@lru_cache(maxsize=1)
+def _get_presign_client():
+    # Хост входить у підпис URL, тому для браузера підписуємо публічною адресою MinIO
+    if settings.s3_public_endpoint:
+        return _build_s3_client(settings.s3_public_endpoint)
+    return _get_s3_client()
+
+
+# Бакети, існування яких уже перевірено в цьому процесі.
+_VERIFIED_BUCKETS: set[str] = set()
+
+
 def ensure_bucket_exists(bucket: str) -> None:
+    """
+    Перевіряє (і за потреби створює) бакет один раз за життя процесу,
+    щоб не робити HeadBucket перед кожним upload.
+    """
+    if bucket in _VERIFIED_BUCKETS:
+        return
+
     s3 = _get_s3_client()
     try:
         s3.head_bucket(Bucket=bucket)
     except ClientError:
         s3.create_bucket(Bucket=bucket)
 
+    _VERIFIED_BUCKETS.add(bucket)
+
 
 def upload_stream(fileobj: BinaryIO, original_name: str, content_type: str) -> str:
     """
@@ -37,19 +93,127 @@ def upload_stream(fileobj: BinaryIO, original_name: str, content_type: str) -> s
     """
     s3 = _get_s3_client()
     bucket = settings.s3_bucket
+    object_key = _make_object_key(original_name)
+
+    size = _stream_size(fileobj)
+    if size is not None and size < MULTIPART_THRESHOLD:
+        s3.put_object(
+            Bucket=bucket,
+            Key=object_key,
+            Body=fileobj.read(),
+            ContentType=content_type,
+        )
+    else:
+        s3.upload_fileobj(
+            Fileobj=fileobj,
+            Bucket=bucket,
+            Key=object_key,
+            ExtraArgs={"ContentType": content_type},
+            Config=TRANSFER_CONFIG,
+        )
 
-    safe_name = original_name.replace("/", "_").replace("\\", "_")
-    object_key = f"uploads/{uuid.uuid4()}-{safe_name}"
+    return object_key
+
+
+async def upload_stream_multipart(
+    chunks: AsyncIterator[bytes],
+    original_name: str,
+    content_type: str,
+) -> str:
+    """
+    Потоково вантажить байти в MinIO через multipart upload і повертає object_key.
+    В пам'яті тримається не більше однієї частини, на диск нічого не пишеться.
+    """
+    s3 = _get_s3_client()
+    bucket = settings.s3_bucket
+    object_key = _make_object_key(original_name)
 
-    s3.upload_fileobj(
-        Fileobj=fileobj,
+    mpu = await asyncio.to_thread(
+        s3.create_multipart_upload,
         Bucket=bucket,
         Key=object_key,
-        ExtraArgs={"ContentType": content_type},
+        ContentType=content_type,
     )
+    upload_id = mpu["UploadId"]
+    parts: list[dict] = []
+
+    async def flush(data: bytes) -> None:
+        part_number = len(parts) + 1
+        resp = await asyncio.to_thread(
+            s3.upload_part,
+            Bucket=bucket,
+            Key=object_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        parts.append({"PartNumber": part_number, "ETag": resp["ETag"]})
+
+    try:
+        buffer = bytearray()
+        async for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= STREAM_PART_SIZE:
+                await flush(bytes(buffer[:STREAM_PART_SIZE]))
+                del buffer[:STREAM_PART_SIZE]
+        # Остання частина може бути меншою; порожній файл — теж одна частина
+        if buffer or not parts:
+            await flush(bytes(buffer))
+
+        await asyncio.to_thread(
+            s3.complete_multipart_upload,
+            Bucket=bucket,
+            Key=object_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except BaseException:
+        # BaseException — щоб abort спрацював і при скасуванні запиту (CancelledError)
+        await asyncio.to_thread(
+            s3.abort_multipart_upload,
+            Bucket=bucket,
+            Key=object_key,
+            UploadId=upload_id,
+        )
+        raise
 
     return object_key
 
+
+def _make_object_key(original_name: str) -> str:
+    safe_name = original_name.replace("/", "_").replace("\\", "_")
+    return f"uploads/{uuid.uuid4()}-{safe_name}"
+
+
+def _stream_size(fileobj: BinaryIO) -> int | None:
+    """
+    Кількість байтів, що лишилась у потоці від поточної позиції,
+    або None, якщо розмір визначити не вдалося.
+    """
+    try:
+        pos = fileobj.tell()
+        end = fileobj.seek(0, os.SEEK_END)
+        fileobj.seek(pos)
+        return end - pos
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def presign_put(original_name: str, content_type: str, expires: int = 3600) -> tuple[str, str]:
+    """
+    Генерує presigned PUT URL, щоб клієнт вантажив файл напряму в MinIO.
+    Повертає (object_key, url).
+    """
+    s3 = _get_presign_client()
+    object_key = _make_object_key(original_name)
+    url = s3.generate_presigned_url(
+        "put_object",
+        Params={"Bucket": settings.s3_bucket, "Key": object_key, "ContentType": content_type},
+        ExpiresIn=expires,
+    )
+    return object_key, url
+
+
 def download_file(bucket: str, object_key: str) -> bytes:
     s3 = _get_s3_client()
     response = s3.get_object(Bucket=bucket, Key=object_key)
@@ -1,26 +1,59 @@
+import tempfile
 import uuid
+from typing import BinaryIO, Protocol
+
 from sqlalchemy.orm import Session
 
+from app.db.base import safe_list
 from app.models.submission_file import SubmissionFile
 from app.core.config import settings
 from app.services.storage import ensure_bucket_exists, upload_stream
+from app.services.thesis_validation.validator import content_hasher
+
+# До цього розміру файл тримаємо в пам'яті, більші — у тимчасовому файлі
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class AsyncReader(Protocol):
+    """Будь-яке джерело з async read(size), напр. UploadFile."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+async def spool_upload(file: AsyncReader) -> tuple[BinaryIO, int, str]:
+    """
+    Один раз читає upload у SpooledTemporaryFile, паралельно рахуючи розмір і хеш.
+    Повертає (spool, size_bytes, digest); spool перемотаний на початок.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    hasher = content_hasher()
+    size = 0
+    try:
+        while chunk := await file.read(READ_CHUNK_SIZE):
+            hasher.update(chunk)
+            spool.write(chunk)
+            size += len(chunk)
+    except BaseException:
+        # Напр. клієнт відключився посеред upload — spool нікому не дістанеться
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool, size, hasher.hexdigest()
 
 
 def upload_submission_file(
     db: Session,
     submission_id: uuid.UUID,
-    fileobj,
+    fileobj: BinaryIO,
     original_name: str,
     content_type: str,
     size_bytes: int | None = None,
 ) -> SubmissionFile:
     ensure_bucket_exists(settings.s3_bucket)
 
-    file_bytes = fileobj.read()
-
-    import io
     object_key = upload_stream(
-        fileobj=io.BytesIO(file_bytes),
+        fileobj=fileobj,
         original_name=original_name,
         content_type=content_type,
     )
@@ -31,17 +64,17 @@ def upload_submission_file(
         object_key=object_key,
         original_name=original_name,
         content_type=content_type,
-        size_bytes=size_bytes or len(file_bytes),
+        size_bytes=size_bytes,
     )
     db.add(record)
     db.commit()
     db.refresh(record)
-    return record, file_bytes
+    return record
 
 
 def get_submission_files(db: Session, submission_id: uuid.UUID) -> list[SubmissionFile]:
     return (
-        db.query(SubmissionFile)
+        safe_list(db.query(SubmissionFile))
         .filter(SubmissionFile.submission_id == submission_id)
         .all()
     )
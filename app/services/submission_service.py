@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.db.base import safe_list
 from app.models.submission import Submission
 from app.models.submission_author import SubmissionAuthor
 from app.schemas.submission import SubmissionCreate
@@ -60,6 +61,19 @@ def get_submission(db: Session, submission_id: uuid.UUID) -> Submission | None:
     )
 
 
+def get_submissions_by_ids(db: Session, submission_ids: list[uuid.UUID]) -> list[Submission]:
+    """Повертає заявки одним запитом у порядку переданих ID."""
+    if not submission_ids:
+        return []
+    rows = (
+        safe_list(db.query(Submission).options(selectinload(Submission.authors)))
+        .filter(Submission.id.in_(submission_ids))
+        .all()
+    )
+    by_id = {s.id: s for s in rows}
+    return [by_id[i] for i in submission_ids if i in by_id]
+
+
 def list_submissions(
     db: Session,
     conference_id: uuid.UUID | None = None,
@@ -68,7 +82,7 @@ def list_submissions(
     current_user_id=None,
     role_ids: list[int] = [],
 ) -> list[Submission]:
-    q = db.query(Submission).options(joinedload(Submission.authors))
+    q = safe_list(db.query(Submission).options(selectinload(Submission.authors)))
 
     if current_user_id and 2 not in role_ids and 3 not in role_ids:
         q = q.filter(Submission.author_id == current_user_id)
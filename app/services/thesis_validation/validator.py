@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import re
 import io
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO, Callable, Iterable, Iterator, NamedTuple
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.oxml.simpletypes import ST_HpsMeasure
 from docx.shared import Length, Pt
+from docx.text.paragraph import Paragraph
+from lxml import etree
 
 from .models import Severity, ValidationIssue, ValidationReport
 
@@ -36,6 +44,28 @@ LINE_SPACING_TOL = 0.06
 MIN_TEXT_CHARS = 800     # примерно 1 стр с 14pt
 MAX_TEXT_CHARS = 6500    # примерно 2 стр с 14pt
 
+# Кэш отчётов по хэшу содержимого файла: повторная проверка того же DOCX не парсит его заново
+REPORT_CACHE_SIZE = 256
+
+# Регулярки компилируем один раз при импорте
+_RE_AUTHORS = re.compile(r"[A-Za-zА-ЯІЇЄҐа-яіїєґ’\-]+\s+[A-ZА-ЯІЇЄҐ]\.\s*[A-ZА-ЯІЇЄҐ]\.")
+_RE_LIT_ITEM = re.compile(r"^\s*\d+\.")
+_RE_CAPTION = re.compile(r"^(?:Рис\.|Таблиця)\s*\d+")
+_RE_WS = re.compile(r"\s+")
+
+# Стили run'ов читаем прямо из XML: дескрипторы python-docx (r.font.name,
+# r.bold, ...) на каждое обращение заново ищут rPr и конвертируют значения.
+_XP_RUNS = etree.XPath("./w:r", namespaces={"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"})
+_W_T = qn("w:t")
+_W_NO_BREAK_HYPHEN = qn("w:noBreakHyphen")
+_W_RPR = qn("w:rPr")
+_W_RFONTS = qn("w:rFonts")
+_W_ASCII = qn("w:ascii")
+_W_SZ = qn("w:sz")
+_W_B = qn("w:b")
+_W_I = qn("w:i")
+_W_VAL = qn("w:val")
+
 
 @dataclass(frozen=True)
 class ThesisStyleRules:
@@ -52,29 +82,107 @@ class ThesisStyleRules:
     require_literature_block: bool = True
 
 
-def validate_thesis_docx(path: str | Path, rules: ThesisStyleRules | None = None) -> ValidationReport:
+_report_cache: OrderedDict[tuple[str, ThesisStyleRules], ValidationReport] = OrderedDict()
+_report_cache_lock = threading.Lock()
+
+
+def content_hasher():
+    """Хэш содержимого файла, по которому кэшируются отчёты."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def validate_thesis_docx(path: str | Path | BinaryIO, rules: ThesisStyleRules | None = None) -> ValidationReport:
     rules = rules or ThesisStyleRules()
-    doc = Document(path)
 
+    if isinstance(path, (str, Path)):
+        data = Path(path).read_bytes()
+    else:
+        data = path.read()
+
+    hasher = content_hasher()
+    hasher.update(data)
+    return _validate_cached(hasher.hexdigest(), rules, lambda: Document(io.BytesIO(data)))
+
+
+def validate_thesis_docx_from_fileobj(
+    fileobj: BinaryIO,
+    digest: str,
+    rules: ThesisStyleRules | None = None,
+) -> ValidationReport:
+    """
+    Вариант для уже прочитанного и захэшированного файла (digest от content_hasher()):
+    python-docx читает DOCX прямо из fileobj, без лишней копии в памяти.
+    """
+    rules = rules or ThesisStyleRules()
+    fileobj.seek(0)
+    return _validate_cached(digest, rules, lambda: Document(fileobj))
+
+
+def _validate_cached(digest: str, rules: ThesisStyleRules, load: Callable[[], Document]) -> ValidationReport:
+    key = (digest, rules)
+    with _report_cache_lock:
+        cached = _report_cache.get(key)
+        if cached is not None:
+            _report_cache.move_to_end(key)
+            # Глибока копія: issues і їхні details не повинні ділитися з кэшем
+            return copy.deepcopy(cached)
+
+    report = _validate_document(load(), rules)
+
+    with _report_cache_lock:
+        _report_cache[key] = report
+        _report_cache.move_to_end(key)
+        while len(_report_cache) > REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+
+    return copy.deepcopy(report)
+
+
+def _validate_document(doc: Document, rules: ThesisStyleRules) -> ValidationReport:
     issues: list[ValidationIssue] = []
 
+    # Один проход по абзацам: .text в python-docx склеивает run'ы при каждом
+    # обращении, поэтому тексты считаем один раз и раздаём всем проверкам.
+    raw_texts: list[str] = []
+    non_empty: list[tuple[Paragraph, str]] = []
+    lit_pos = None       # первый «Література» среди непустых абзацев
+    body_lit_pos = None  # первый «Література» после заголовочной части
+    for p in doc.paragraphs:
+        raw = p.text or ""
+        raw_texts.append(raw)
+        txt = raw.strip()
+        if not txt:
+            continue
+        if body_lit_pos is None and txt.lower() == "література":
+            if lit_pos is None:
+                lit_pos = len(non_empty)
+            if len(non_empty) >= 3:
+                body_lit_pos = len(non_empty)
+        non_empty.append((p, txt))
+    chars = len(_RE_WS.sub(" ", "\n".join(raw_texts).strip()))
+
+    # Проверки выполняются последовательно намеренно: GIL отпускается только при
+    # разборе XML в Document(), а обход run'ов/стилей — чистый Python. Пул потоков
+    # здесь ничего не ускоряет (время почти целиком уходит на проверку тела),
+    # параллелизм есть между загрузками — они уже идут в threadpool.
+
     # 1) Параметры страницы: A4 + поля 20 мм, запрет колонтитулов/нумерации :contentReference[oaicite:2]{index=2}
     issues += _check_page_setup(doc, rules)
 
     # 2) Структура и заголовочная часть: title/authors/org по центру, title CAPS, authors italic :contentReference[oaicite:3]{index=3}
-    issues += _check_header_structure(doc, rules)
+    issues += _check_header_structure(non_empty, rules)
 
     # 3) Основной текст: выравнивание по ширине, интервал 1.15, отступ 1.25 :contentReference[oaicite:4]{index=4}
-    issues += _check_body_paragraphs(doc, rules)
+    issues += _check_body_paragraphs(non_empty, body_lit_pos, rules)
 
     # 4) Литература: блок «Література» в конце, нумерация арабскими цифрами :contentReference[oaicite:5]{index=5}
-    issues += _check_literature(doc, rules)
+    issues += _check_literature(non_empty, lit_pos, rules)
 
     # 5) Подписи рисунков/таблиц (по тексту): "Рис." / "Таблиця", 12 pt :contentReference[oaicite:6]{index=6}
-    issues += _check_captions(doc)
+    issues += _check_captions(non_empty)
 
     # 6) Объём 1-2 страницы (эвристика) :contentReference[oaicite:7]{index=7}
-    issues += _check_length_heuristic(doc)
+    issues += _check_length_heuristic(chars)
 
     ok = not any(i.severity == Severity.ERROR for i in issues)
     return ValidationReport(ok=ok, issues=issues)
@@ -82,6 +190,45 @@ def validate_thesis_docx(path: str | Path, rules: ThesisStyleRules | None = None
 
 # ---------------- internal checks ----------------
 
+class _RunStyle(NamedTuple):
+    name: str | None
+    size_pt: float | None
+    bold: bool | None
+    italic: bool | None
+
+
+def _run_styles(p: Paragraph) -> Iterator[_RunStyle]:
+    """
+    Стили непустых run'ов абзаца (те же значения, что r.font.name/size, r.bold/italic).
+    Генератор: проверки, которые выходят по первому нарушению, не разбирают остальные run'ы.
+    """
+    for r in _XP_RUNS(p._p):
+        # run.text: пробельные w:tab/w:br не в счёт, w:noBreakHyphen даёт "-"
+        if not any((t.text or "").strip() for t in r.iterfind(_W_T)) and r.find(_W_NO_BREAK_HYPHEN) is None:
+            continue
+
+        rpr = r.find(_W_RPR)
+        if rpr is None:
+            yield _RunStyle(None, None, None, None)
+            continue
+
+        fonts = rpr.find(_W_RFONTS)
+        sz = rpr.find(_W_SZ)
+        sz_val = sz.get(_W_VAL) if sz is not None else None
+        yield _RunStyle(
+            name=fonts.get(_W_ASCII) if fonts is not None else None,
+            size_pt=ST_HpsMeasure.convert_from_xml(sz_val).pt if sz_val is not None else None,
+            bold=_on_off(rpr.find(_W_B)),
+            italic=_on_off(rpr.find(_W_I)),
+        )
+
+
+def _on_off(el) -> bool | None:
+    if el is None:
+        return None
+    return el.get(_W_VAL, "true") in ("1", "true", "on")
+
+
 def _check_page_setup(doc: Document, rules: ThesisStyleRules) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
     for idx, section in enumerate(doc.sections):
@@ -142,11 +289,10 @@ def _section_has_header_footer_text(section) -> bool:
     return False
 
 
-def _check_header_structure(doc: Document, rules: ThesisStyleRules) -> list[ValidationIssue]:
+def _check_header_structure(paragraphs: list[tuple[Paragraph, str]], rules: ThesisStyleRules) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
 
     # Берем первые 3 непустых абзаца: title, authors, organization
-    paragraphs = [p for p in doc.paragraphs if (p.text or "").strip()]
     if len(paragraphs) < 3:
         return [ValidationIssue(
             code="HEADER_TOO_SHORT",
@@ -154,26 +300,26 @@ def _check_header_structure(doc: Document, rules: ThesisStyleRules) -> list[Vali
             message="Не найдено минимум 3 строки заголовочной части: назва, автори, організація.",
         )]
 
-    title_p, authors_p, org_p = paragraphs[0], paragraphs[1], paragraphs[2]
+    (title_p, title_text), (authors_p, authors_text), (org_p, org_text) = paragraphs[:3]
 
     # Центрирование заголовка/авторов/организации :contentReference[oaicite:10]{index=10}
     if rules.header_centered:
-        for code, p, label in [
-            ("TITLE_NOT_CENTER", title_p, "назва"),
-            ("AUTHORS_NOT_CENTER", authors_p, "автори"),
-            ("ORG_NOT_CENTER", org_p, "організація"),
+        for code, p, text, label in [
+            ("TITLE_NOT_CENTER", title_p, title_text, "назва"),
+            ("AUTHORS_NOT_CENTER", authors_p, authors_text, "автори"),
+            ("ORG_NOT_CENTER", org_p, org_text, "організація"),
         ]:
             if p.alignment != WD_ALIGN_PARAGRAPH.CENTER:
                 issues.append(ValidationIssue(
                     code=code,
                     severity=Severity.ERROR,
                     message=f"Строка «{label}» должна быть выровнена по центру.",
-                    details={"text": (p.text or "").strip()},
+                    details={"text": text},
                 ))
 
     # Title uppercase :contentReference[oaicite:11]{index=11}
-    title_text = (title_p.text or "").strip()
-    if rules.title_uppercase and title_text and title_text != title_text.upper():
+    # isupper() проверяет в C без копии строки; для строк без букв он даёт False — их не трогаем
+    if rules.title_uppercase and not title_text.isupper() and any(c.isalpha() for c in title_text):
         issues.append(ValidationIssue(
             code="TITLE_NOT_UPPERCASE",
             severity=Severity.ERROR,
@@ -182,36 +328,35 @@ def _check_header_structure(doc: Document, rules: ThesisStyleRules) -> list[Vali
         ))
 
     # Шрифт/кегль/жирность для заголовочной части :contentReference[oaicite:12]{index=12}
-    issues += _check_paragraph_font(title_p, rules, must_bold=True, must_italic=False, where="title")
-    issues += _check_paragraph_font(authors_p, rules, must_bold=True, must_italic=rules.authors_italic, where="authors")
-    issues += _check_paragraph_font(org_p, rules, must_bold=True, must_italic=False, where="organization")
+    issues += _check_paragraph_font(title_p, title_text, rules, must_bold=True, must_italic=False, where="title")
+    issues += _check_paragraph_font(authors_p, authors_text, rules, must_bold=True, must_italic=rules.authors_italic, where="authors")
+    issues += _check_paragraph_font(org_p, org_text, rules, must_bold=True, must_italic=False, where="organization")
 
     # Авторы перечисляются через запятую, инициалы после фамилии (простая эвристика) :contentReference[oaicite:13]{index=13}
-    if "," not in (authors_p.text or ""):
+    if "," not in authors_text:
         issues.append(ValidationIssue(
             code="AUTHORS_LIST_FORMAT",
             severity=Severity.WARNING,
             message="Авторы обычно перечисляются через запятую.",
-            details={"authors_line": (authors_p.text or "").strip()},
+            details={"authors_line": authors_text},
         ))
     # Эвристика "Фамилия І. О." (кириллица/латиница)
-    if not re.search(r"[A-Za-zА-ЯІЇЄҐа-яіїєґ’\-]+\s+[A-ZА-ЯІЇЄҐ]\.\s*[A-ZА-ЯІЇЄҐ]\.", authors_p.text or ""):
+    if not _RE_AUTHORS.search(authors_text):
         issues.append(ValidationIssue(
             code="AUTHORS_INITIALS_PATTERN",
             severity=Severity.WARNING,
             message="Проверь формат Фамилия И.О. (инициалы после фамилии).",
-            details={"authors_line": (authors_p.text or "").strip()},
+            details={"authors_line": authors_text},
         ))
 
     return issues
 
 
-def _check_paragraph_font(p, rules: ThesisStyleRules, must_bold: bool, must_italic: bool, where: str) -> list[ValidationIssue]:
+def _check_paragraph_font(p, text: str, rules: ThesisStyleRules, must_bold: bool, must_italic: bool, where: str) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
 
     # В DOCX шрифт может быть задан на run'ах, а в paragraph style.
     # Мы проверяем runs; если run без name/size — считаем "неизвестно" (warning).
-    text = (p.text or "").strip()
     if not text:
         return issues
 
@@ -223,32 +368,32 @@ def _check_paragraph_font(p, rules: ThesisStyleRules, must_bold: bool, must_ital
     bad_italic = False
     unknown_font = False
 
-    for r in p.runs:
-        if not (r.text or "").strip():
-            continue
+    for name, size_pt, bold, italic in _run_styles(p):
         any_run = True
 
-        name = r.font.name
-        size = r.font.size
-
         if name is None:
             unknown_font = True
         else:
             if name != rules.font_name:
                 bad_name = True
 
-        if size is None:
+        if size_pt is None:
             unknown_font = True
         else:
-            if abs(size.pt - rules.font_size_pt) > FONT_SIZE_TOL:
+            if abs(size_pt - rules.font_size_pt) > FONT_SIZE_TOL:
                 bad_size = True
 
-        if must_bold and r.bold is not True:
+        if must_bold and bold is not True:
             bad_bold = True
 
-        if must_italic and r.italic is not True:
+        if must_italic and italic is not True:
             bad_italic = True
 
+        # Все возможные ошибки уже найдены (FONT_UNKNOWN при bad_name/bad_size не выдаётся) —
+        # остальные run'ы отчёт не изменят
+        if bad_name and bad_size and (bad_bold or not must_bold) and (bad_italic or not must_italic):
+            break
+
     if not any_run:
         unknown_font = True
 
@@ -291,31 +436,22 @@ def _check_paragraph_font(p, rules: ThesisStyleRules, must_bold: bool, must_ital
     return issues
 
 
-def _check_body_paragraphs(doc: Document, rules: ThesisStyleRules) -> list[ValidationIssue]:
+def _check_body_paragraphs(
+    paragraphs: list[tuple[Paragraph, str]],
+    lit_pos: int | None,
+    rules: ThesisStyleRules,
+) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
 
-    paragraphs = [p for p in doc.paragraphs if (p.text or "").strip()]
     if len(paragraphs) < 4:
         return issues
 
     # Считаем, что body начинается после 3й строки (title/authors/org)
-    body = paragraphs[3:]
-
-    # Найдем "Література" и ограничим body до него
-    lit_idx = None
-    for i, p in enumerate(body):
-        if (p.text or "").strip().lower() == "література":
-            lit_idx = i
-            break
-    if lit_idx is not None:
-        body = body[:lit_idx]
+    # и заканчивается перед "Література"
+    body = paragraphs[3:lit_pos]
 
     # Проверяем первые N абзацев тела (чтобы не гонять весь документ)
-    sample = body[:30] if len(body) > 30 else body
-    for p in sample:
-        txt = (p.text or "").strip()
-        if not txt:
-            continue
+    for p, txt in body[:30]:
 
         # Выравнивание по ширине :contentReference[oaicite:14]{index=14}
         if rules.body_justify and p.alignment not in (None, WD_ALIGN_PARAGRAPH.JUSTIFY):
@@ -360,42 +496,37 @@ def _check_body_paragraphs(doc: Document, rules: ThesisStyleRules) -> list[Valid
                 ))
 
         # Шрифт/кегль для тела (мягко: warning, потому что стиль может быть на уровне style)
-        for r in p.runs:
-            if not (r.text or "").strip():
-                continue
-            if r.font.name and r.font.name != rules.font_name:
+        for name, size_pt, _, _ in _run_styles(p):
+            if name and name != rules.font_name:
                 issues.append(ValidationIssue(
                     code="BODY_FONT_NAME_MISMATCH",
                     severity=Severity.WARNING,
                     message=f"Основной текст должен быть {rules.font_name}.",
-                    details={"paragraph": txt[:80], "font": r.font.name},
+                    details={"paragraph": txt[:80], "font": name},
                 ))
                 break
-            if r.font.size and abs(r.font.size.pt - rules.font_size_pt) > FONT_SIZE_TOL:
+            if size_pt and abs(size_pt - rules.font_size_pt) > FONT_SIZE_TOL:
                 issues.append(ValidationIssue(
                     code="BODY_FONT_SIZE_MISMATCH",
                     severity=Severity.WARNING,
                     message=f"Основной текст должен быть {rules.font_size_pt} pt.",
-                    details={"paragraph": txt[:80], "size_pt": r.font.size.pt},
+                    details={"paragraph": txt[:80], "size_pt": size_pt},
                 ))
                 break
 
     return issues
 
 
-def _check_literature(doc: Document, rules: ThesisStyleRules) -> list[ValidationIssue]:
+def _check_literature(
+    paragraphs: list[tuple[Paragraph, str]],
+    lit_pos: int | None,
+    rules: ThesisStyleRules,
+) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
-    paragraphs = [p for p in doc.paragraphs if (p.text or "").strip()]
     if not paragraphs:
         return issues
 
-    # Ищем точный заголовок "Література" :contentReference[oaicite:17]{index=17}
-    lit_pos = None
-    for i, p in enumerate(paragraphs):
-        if (p.text or "").strip().lower() == "література":
-            lit_pos = i
-            break
-
+    # Точный заголовок "Література" ищется в общем проходе :contentReference[oaicite:17]{index=17}
     if rules.require_literature_block and lit_pos is None:
         issues.append(ValidationIssue(
             code="LITERATURE_MISSING",
@@ -418,7 +549,7 @@ def _check_literature(doc: Document, rules: ThesisStyleRules) -> list[Validation
 
     # Проверим, что после заголовка есть хотя бы 1-2 пункта
     after = paragraphs[lit_pos + 1 : lit_pos + 6]
-    has_item = any(re.match(r"^\s*\d+\.", (p.text or "").strip()) for p in after)
+    has_item = any(_RE_LIT_ITEM.match(txt) for _, txt in after)
     if not has_item:
         issues.append(ValidationIssue(
             code="LITERATURE_ITEMS_FORMAT",
@@ -429,34 +560,26 @@ def _check_literature(doc: Document, rules: ThesisStyleRules) -> list[Validation
     return issues
 
 
-def _check_captions(doc: Document) -> list[ValidationIssue]:
+def _check_captions(paragraphs: list[tuple[Paragraph, str]]) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
-    for p in doc.paragraphs:
-        txt = (p.text or "").strip()
-        if not txt:
-            continue
-
+    for p, txt in paragraphs:
         # Рис. <номер> ... / Таблиця <номер> ...
-        if re.match(r"^(Рис\.\s*\d+)", txt) or re.match(r"^(Таблиця\s*\d+)", txt):
+        if _RE_CAPTION.match(txt):
             # Проверяем 12 pt на run'ах (если видно)
-            for r in p.runs:
-                if not (r.text or "").strip():
-                    continue
-                if r.font.size and abs(r.font.size.pt - CAPTION_SIZE_PT) > 0.5:
+            for _, size_pt, _, _ in _run_styles(p):
+                if size_pt and abs(size_pt - CAPTION_SIZE_PT) > 0.5:
                     issues.append(ValidationIssue(
                         code="CAPTION_SIZE_MISMATCH",
                         severity=Severity.WARNING,
                         message="Подписи к рисункам/таблицам желательно оформлять 12 pt.",
-                        details={"caption": txt[:80], "size_pt": r.font.size.pt},
+                        details={"caption": txt[:80], "size_pt": size_pt},
                     ))
                     break
     return issues
 
 
-def _check_length_heuristic(doc: Document) -> list[ValidationIssue]:
+def _check_length_heuristic(chars: int) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
-    text = "\n".join((p.text or "") for p in doc.paragraphs).strip()
-    chars = len(re.sub(r"\s+", " ", text))
 
     # Требование 1-2 страницы :contentReference[oaicite:18]{index=18}
     if chars < MIN_TEXT_CHARS:
@@ -1,18 +1,21 @@
-import io
 import uuid
-from sqlalchemy.orm import Session
+from typing import BinaryIO
+
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.models.validation_report import ValidationReport
-from app.services.thesis_validation.validator import validate_thesis_docx
+from app.services.thesis_validation.models import Severity, ValidationIssue
+from app.services.thesis_validation.validator import validate_thesis_docx_from_fileobj
 
 
 def validate_and_save(
     db: Session,
     submission_file_id: uuid.UUID,
-    file_bytes: bytes,
+    fileobj: BinaryIO,
+    digest: str,
 ) -> ValidationReport:
-    # запускаем валидатор из байтов
-    report = validate_thesis_docx(io.BytesIO(file_bytes))
+    # файл уже прочитан и захэширован при загрузке — валидатор читает его же
+    report = validate_thesis_docx_from_fileobj(fileobj, digest)
 
     record = ValidationReport(
         submission_file_id=submission_file_id,
@@ -25,6 +28,44 @@ def validate_and_save(
     return record
 
 
+def validate_in_background(
+    session_factory: sessionmaker,
+    submission_file_id: uuid.UUID,
+    fileobj: BinaryIO,
+    digest: str,
+) -> None:
+    """
+    Фонова перевірка DOCX після відповіді на upload.
+    Сесія запиту на цей момент уже закрита, тому відкриваємо власну з session_factory.
+    Закриває fileobj після перевірки.
+    Якщо перевірка впала, зберігає звіт з помилкою, щоб опитування клієнта завершилось.
+    """
+    db = session_factory()
+    try:
+        validate_and_save(db, submission_file_id, fileobj, digest)
+    except Exception as e:
+        print(f"[validation] Помилка перевірки файлу {submission_file_id}: {e}")
+        db.rollback()
+        _save_failed_report(db, submission_file_id, e)
+    finally:
+        db.close()
+        fileobj.close()
+
+
+def _save_failed_report(db: Session, submission_file_id: uuid.UUID, error: Exception) -> None:
+    issue = ValidationIssue(
+        code="VALIDATION_FAILED",
+        severity=Severity.ERROR,
+        message=f"Не вдалося перевірити файл: {error}",
+    )
+    try:
+        db.add(ValidationReport(submission_file_id=submission_file_id, ok=False, issues=[issue.to_dict()]))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"[validation] Не вдалося зберегти звіт для файлу {submission_file_id}: {e}")
+
+
 def get_report(db: Session, submission_file_id: uuid.UUID) -> ValidationReport | None:
     return (
         db.query(ValidationReport)
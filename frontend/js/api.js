@@ -23,7 +23,9 @@ async function request(method, path, body = null, auth = true) {
 
   if (!response.ok) {
     const err = await response.json().catch(() => ({ detail: "Невідома помилка" }));
-    throw new Error(err.detail || "Помилка запиту");
+    const error = new Error(err.detail || "Помилка запиту");
+    error.status = response.status;
+    throw error;
   }
 
   if (response.status === 204) return null;
@@ -60,6 +62,7 @@ const api = {
   // Submission files
   getFiles: (submissionId) => request("GET", `/submissions/${submissionId}/files/`),
   deleteFile: (submissionId, fileId) => request("DELETE", `/submissions/${submissionId}/files/${fileId}`),
+  getValidation: (submissionId, fileId) => request("GET", `/submissions/${submissionId}/files/${fileId}/validation`),
   downloadFile: (submissionId, fileId) => `${API_BASE}/submissions/${submissionId}/files/${fileId}/download`,
   uploadFile: async (submissionId, file) => {
     const token = localStorage.getItem("token");
@@ -195,28 +195,53 @@ async function uploadFile() {
 
   try {
     const result = await api.uploadFile(currentSubmissionId, file);
-    let html = `<div class="alert alert-success">Файл завантажено!</div>`;
-    if (result.validation) {
-      const v = result.validation;
-      if (v.ok === true) {
-        html += `<div class="alert alert-success"><i class="bi bi-check-circle"></i> Тези оформлені коректно</div>`;
-      } else if (v.ok === false) {
-        const errors = v.issues.filter(i => i.severity === "error");
-        const warnings = v.issues.filter(i => i.severity === "warning");
-        html += `<div class="alert alert-warning">
-          <strong>Знайдено проблеми:</strong><br>
-          ${errors.map(i => `<div class="text-danger"><i class="bi bi-x-circle"></i> ${i.message}</div>`).join("")}
-          ${warnings.map(i => `<div class="text-warning"><i class="bi bi-exclamation-triangle"></i> ${i.message}</div>`).join("")}
-        </div>`;
-      }
-    }
-    resultEl.innerHTML = html;
+    const uploadedHtml = `<div class="alert alert-success">Файл завантажено!</div>`;
+    resultEl.innerHTML = uploadedHtml;
     await loadFiles();
+
+    if (result.validation && result.validation.status === "pending") {
+      resultEl.innerHTML = uploadedHtml + `<div class="alert alert-info">Перевірка оформлення...</div>`;
+      const v = await waitForValidation(currentSubmissionId, result.id);
+      resultEl.innerHTML = uploadedHtml + renderValidation(v);
+    }
   } catch (e) {
     resultEl.innerHTML = `<div class="alert alert-danger">${e.message}</div>`;
   }
 }
 
+// Валідація виконується у фоні — опитуємо звіт, поки він не з'явиться (404 — ще не готовий)
+async function waitForValidation(submissionId, fileId, attempts = 15, delayMs = 1000) {
+  for (let i = 0; i < attempts; i++) {
+    try {
+      return await api.getValidation(submissionId, fileId);
+    } catch (e) {
+      if (e.status !== 404) throw e;
+      await new Promise(resolve => setTimeout(resolve, delayMs));
+    }
+  }
+  return null;
+}
+
+function renderValidation(v) {
+  let html = "";
+  if (v) {
+    if (v.ok === true) {
+      html += `<div class="alert alert-success"><i class="bi bi-check-circle"></i> Тези оформлені коректно</div>`;
+    } else if (v.ok === false) {
+      const errors = v.issues.filter(i => i.severity === "error");
+      const warnings = v.issues.filter(i => i.severity === "warning");
+      html += `<div class="alert alert-warning">
+        <strong>Знайдено проблеми:</strong><br>
+        ${errors.map(i => `<div class="text-danger"><i class="bi bi-x-circle"></i> ${i.message}</div>`).join("")}
+        ${warnings.map(i => `<div class="text-warning"><i class="bi bi-exclamation-triangle"></i> ${i.message}</div>`).join("")}
+      </div>`;
+    }
+  } else {
+    html += `<div class="alert alert-secondary">Результат перевірки ще не готовий — перегляньте пізніше.</div>`;
+  }
+  return html;
+}
+
 async function removeFile(fileId) {
   if (!confirm("Видалити файл?")) return;
   try {
@@ -0,0 +1,36 @@
+"""add fk lookup indexes
+
+Revision ID: 5c2e8f1a9d47
+Revises: 24cf112aebbe
+Create Date: 2026-10-15 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e8f1a9d47'
+down_revision: Union[str, Sequence[str], None] = '24cf112aebbe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_conference_groups_group_id', 'conference_groups', ['group_id'], unique=False)
+    op.create_index('ix_group_members_user_id', 'group_members', ['user_id'], unique=False)
+    op.create_index('ix_user_roles_role_id', 'user_roles', ['role_id'], unique=False)
+    op.create_index('ix_submissions_author_id', 'submissions', ['author_id'], unique=False)
+    op.create_index('ix_submissions_conference_status', 'submissions', ['conference_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_submissions_conference_status', table_name='submissions')
+    op.drop_index('ix_submissions_author_id', table_name='submissions')
+    op.drop_index('ix_user_roles_role_id', table_name='user_roles')
+    op.drop_index('ix_group_members_user_id', table_name='group_members')
+    op.drop_index('ix_conference_groups_group_id', table_name='conference_groups')
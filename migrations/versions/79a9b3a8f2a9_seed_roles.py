@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 
 # revision identifiers, used by Alembic.
@@ -18,18 +19,29 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+roles_table = sa.table(
+    'roles',
+    sa.column('id', sa.SmallInteger),
+    sa.column('name', sa.String),
+)
+
+ROLES = [
+    {'id': 1, 'name': 'participant'},
+    {'id': 2, 'name': 'org_committee'},
+    {'id': 3, 'name': 'admin'},
+]
+
+
 def upgrade() -> None:
-    op.execute("""
-    INSERT INTO roles (id, name) VALUES
-      (1, 'participant'),
-      (2, 'org_committee'),
-      (3, 'admin')
-    ON CONFLICT (id) DO NOTHING;
-    """)
+    # Один INSERT ... VALUES на всі рядки; вже наявні ролі пропускаємо
+    op.execute(
+        pg_insert(roles_table)
+        .values(ROLES)
+        .on_conflict_do_nothing(index_elements=['id'])
+    )
 
 
 def downgrade() -> None:
-    op.execute("""
-    DELETE FROM roles
-    WHERE id IN (1, 2, 3);
-    """)
+    op.execute(
+        roles_table.delete().where(roles_table.c.id.in_([r['id'] for r in ROLES]))
+    )
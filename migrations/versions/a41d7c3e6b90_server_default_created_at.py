@@ -0,0 +1,30 @@
+"""server default created_at for conferences and submissions
+
+Revision ID: a41d7c3e6b90
+Revises: 5c2e8f1a9d47
+Create Date: 2026-10-15 11:03:27.540916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41d7c3e6b90'
+down_revision: Union[str, Sequence[str], None] = '5c2e8f1a9d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('conferences', 'created_at', server_default=sa.text('now()'))
+    op.alter_column('submissions', 'created_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('submissions', 'created_at', server_default=None)
+    op.alter_column('conferences', 'created_at', server_default=None)
@@ -1,11 +1,11 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
 from app.core.security import hash_password
 from app.models.user import User
 from app.models.user_role import UserRole
@@ -70,11 +70,35 @@ def setup_db():
 @pytest.fixture(scope="session")
 def client(setup_db):
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def db_session(setup_db):
+    """Окрема сесія тестової БД для прямих викликів сервісів."""
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def query_counter():
+    """Рахує SQL-запити, виконані через тестовий engine."""
+    counter = {"count": 0}
+
+    def _on_execute(*args):
+        counter["count"] += 1
+
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    yield counter
+    event.remove(engine, "before_cursor_execute", _on_execute)
+
+
 @pytest.fixture(scope="session")
 def admin_token(client):
     response = client.post("/auth/login", json={"email": "admin@test.com", "password": "admin123"})
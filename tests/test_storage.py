@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from app.services import storage
+
+PART = storage.STREAM_PART_SIZE
+
+
+class StubS3:
+    """Записує multipart-виклики замість звернень до MinIO."""
+
+    def __init__(self, fail_on_part: int | None = None):
+        self.fail_on_part = fail_on_part
+        self.calls: list[str] = []
+        self.parts: list[int] = []
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append("create")
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, PartNumber, Body, **kwargs):
+        self.calls.append("upload_part")
+        if PartNumber == self.fail_on_part:
+            raise RuntimeError("part failed")
+        self.parts.append(len(Body))
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, MultipartUpload, **kwargs):
+        self.calls.append("complete")
+        assert [p["PartNumber"] for p in MultipartUpload["Parts"]] == list(range(1, len(self.parts) + 1))
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append("abort")
+
+
+@pytest.fixture
+def stub_s3(monkeypatch):
+    def install(**kwargs):
+        s3 = StubS3(**kwargs)
+        monkeypatch.setattr(storage, "_get_s3_client", lambda: s3)
+        return s3
+    return install
+
+
+async def chunks_of(sizes: list[int]):
+    for size in sizes:
+        yield b"x" * size
+
+
+def upload(sizes: list[int]) -> str:
+    return asyncio.run(storage.upload_stream_multipart(chunks_of(sizes), "thesis.docx", "application/octet-stream"))
+
+
+def test_stream_is_split_into_parts(stub_s3):
+    s3 = stub_s3()
+    # Чанки не збігаються з межами частин; остання частина коротша
+    object_key = upload([PART // 2, PART, PART // 2 + 10])
+
+    assert object_key.endswith("thesis.docx")
+    assert s3.parts == [PART, PART, 10]
+    assert s3.calls[0] == "create" and s3.calls[-1] == "complete"
+
+
+def test_empty_stream_is_one_empty_part(stub_s3):
+    s3 = stub_s3()
+    upload([])
+
+    assert s3.parts == [0]
+    assert s3.calls == ["create", "upload_part", "complete"]
+
+
+def test_failed_part_aborts_upload(stub_s3):
+    s3 = stub_s3(fail_on_part=2)
+    with pytest.raises(RuntimeError):
+        upload([PART, PART, 1])
+
+    assert s3.calls == ["create", "upload_part", "upload_part", "abort"]
+
+
+def test_upload_stream_requires_auth(client):
+    response = client.post("/files/upload-stream", params={"filename": "a.txt"}, content=b"data")
+    assert response.status_code == 401
+
+
+def test_presign_requires_auth(client):
+    response = client.post("/files/presign", json={"original_name": "a.docx", "content_type": "application/octet-stream"})
+    assert response.status_code == 401
@@ -0,0 +1,145 @@
+import asyncio
+import io
+import tempfile
+
+import pytest
+from docx import Document
+
+from app.services import submission_file_service
+
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+@pytest.fixture
+def stub_storage(monkeypatch):
+    # MinIO у тестах немає — запам'ятовуємо, що було б завантажено
+    uploaded = []
+
+    def fake_upload_stream(fileobj, original_name, content_type):
+        uploaded.append(fileobj.read())
+        fileobj.seek(0)
+        return f"uploads/test-{original_name}"
+
+    monkeypatch.setattr(submission_file_service, "ensure_bucket_exists", lambda bucket: None)
+    monkeypatch.setattr(submission_file_service, "upload_stream", fake_upload_stream)
+    return uploaded
+
+
+def make_docx() -> bytes:
+    doc = Document()
+    doc.add_paragraph("ТЕЗИ ДОПОВІДІ")
+    doc.add_paragraph("Текст тез.")
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def create_submission(client, participant_token, admin_token):
+    headers = {"Authorization": f"Bearer {participant_token}"}
+    user_id = client.get("/auth/me", headers=headers).json()["id"]
+    conf_id = client.post(
+        "/conferences/",
+        json={"title": "Conf for files", "submission_deadline": "2027-01-01T00:00:00"},
+        headers={"Authorization": f"Bearer {admin_token}"}
+    ).json()["id"]
+    resp = client.post(
+        "/submissions/",
+        json={
+            "conference_id": conf_id,
+            "author_id": user_id,
+            "title": "Submission with file",
+            "authors": [{"full_name": "Author", "is_presenter": True, "order": 0}]
+        },
+        headers=headers
+    )
+    return resp.json()["id"]
+
+
+def upload(client, token, sub_id, name, data, content_type):
+    return client.post(
+        f"/submissions/{sub_id}/files/",
+        files={"file": (name, data, content_type)},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+def test_docx_upload_is_validated_in_background(client, participant_token, admin_token, stub_storage):
+    sub_id = create_submission(client, participant_token, admin_token)
+    data = make_docx()
+
+    response = upload(client, participant_token, sub_id, "thesis.docx", data, DOCX_CONTENT_TYPE)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["validation"] == {"status": "pending"}
+    assert body["size_bytes"] == len(data)
+    assert stub_storage == [data]
+
+    # TestClient виконує фонові задачі до повернення відповіді
+    report = client.get(
+        f"/submissions/{sub_id}/files/{body['id']}/validation",
+        headers={"Authorization": f"Bearer {participant_token}"}
+    )
+    assert report.status_code == 200
+    assert report.json()["ok"] in (True, False)
+    assert all(i["code"] != "VALIDATION_FAILED" for i in report.json()["issues"])
+
+
+def test_broken_docx_gets_failed_report(client, participant_token, admin_token, stub_storage):
+    sub_id = create_submission(client, participant_token, admin_token)
+
+    response = upload(client, participant_token, sub_id, "broken.docx", b"not a docx", DOCX_CONTENT_TYPE)
+    assert response.status_code == 200
+    file_id = response.json()["id"]
+
+    report = client.get(
+        f"/submissions/{sub_id}/files/{file_id}/validation",
+        headers={"Authorization": f"Bearer {participant_token}"}
+    )
+    assert report.status_code == 200
+    assert report.json()["ok"] is False
+    assert [i["code"] for i in report.json()["issues"]] == ["VALIDATION_FAILED"]
+
+
+def test_non_docx_upload_is_not_validated(client, participant_token, admin_token, stub_storage):
+    sub_id = create_submission(client, participant_token, admin_token)
+
+    response = upload(client, participant_token, sub_id, "slides.pdf", b"%PDF-1.4", "application/pdf")
+    assert response.status_code == 200
+    assert response.json()["validation"] is None
+
+    report = client.get(
+        f"/submissions/{sub_id}/files/{response.json()['id']}/validation",
+        headers={"Authorization": f"Bearer {participant_token}"}
+    )
+    assert report.status_code == 404
+
+
+class BrokenReader:
+    """Віддає один чанк, потім падає — як обірване з'єднання."""
+
+    def __init__(self):
+        self.reads = 0
+
+    async def read(self, size=-1):
+        self.reads += 1
+        if self.reads > 1:
+            raise ConnectionError("client disconnected")
+        return b"x" * 10
+
+
+def test_spool_is_closed_when_read_fails(monkeypatch):
+    spools = []
+    original = tempfile.SpooledTemporaryFile
+
+    def tracking_spool(*args, **kwargs):
+        spool = original(*args, **kwargs)
+        spools.append(spool)
+        return spool
+
+    monkeypatch.setattr(tempfile, "SpooledTemporaryFile", tracking_spool)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(submission_file_service.spool_upload(BrokenReader()))
+
+    assert len(spools) == 1
+    assert spools[0].closed
@@ -1,4 +1,14 @@
+import uuid
+
 import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models.conference_group import ConferenceGroup
+from app.models.group import Group
+from app.models.group_member import GroupMember
+from app.models.submission import Submission
+from app.models.user import User
+from app.services import submission_service
 
 
 def get_participant_id(client, participant_token):
@@ -121,4 +131,68 @@ def test_participant_cannot_change_to_accepted(client, participant_token, admin_
         json={"status": "accepted"},
         headers={"Authorization": f"Bearer {participant_token}"}
     )
-    assert response.status_code == 403
\ No newline at end of file
+    assert response.status_code == 403
+
+
+def test_list_submissions_query_count_is_flat(client, participant_token, admin_token, org_token, query_counter):
+    # Кількість запитів не повинна залежати від кількості заявок (без N+1)
+    headers = {"Authorization": f"Bearer {org_token}"}
+    create_submission(client, participant_token, admin_token)
+
+    query_counter["count"] = 0
+    assert client.get("/submissions/", headers=headers).status_code == 200
+    baseline = query_counter["count"]
+
+    create_submission(client, participant_token, admin_token)
+    create_submission(client, participant_token, admin_token)
+
+    query_counter["count"] = 0
+    assert client.get("/submissions/", headers=headers).status_code == 200
+    assert query_counter["count"] == baseline
+
+
+def test_get_submission_does_not_load_conference_groups(client, participant_token, org_token, admin_token, db_session, query_counter):
+    # Групи й учасники конференції не повинні підтягуватися разом із заявкою
+    headers = {"Authorization": f"Bearer {org_token}"}
+    sub_id = create_submission(client, participant_token, admin_token)
+
+    query_counter["count"] = 0
+    assert client.get(f"/submissions/{sub_id}", headers=headers).status_code == 200
+    baseline = query_counter["count"]
+
+    conf_id = db_session.get(Submission, uuid.UUID(sub_id)).conference_id
+    group = Group(name=f"Group {uuid.uuid4()}")
+    db_session.add(group)
+    db_session.flush()
+    db_session.add(ConferenceGroup(conference_id=conf_id, group_id=group.id))
+    for i in range(20):
+        user = User(email=f"member{i}-{uuid.uuid4()}@test.com", password_hash="x")
+        db_session.add(user)
+        db_session.flush()
+        db_session.add(GroupMember(group_id=group.id, user_id=user.id))
+    db_session.commit()
+
+    query_counter["count"] = 0
+    assert client.get(f"/submissions/{sub_id}", headers=headers).status_code == 200
+    assert query_counter["count"] == baseline
+
+
+def test_list_submissions_raises_on_unloaded_relationship(client, participant_token, admin_token, db_session):
+    # Без safe_list звернення до .conference тихо робило б окремий запит на кожен рядок
+    create_submission(client, participant_token, admin_token)
+
+    submissions = submission_service.list_submissions(db_session)
+    assert submissions
+    assert submissions[0].authors is not None
+    with pytest.raises(InvalidRequestError):
+        _ = submissions[0].conference
+
+
+def test_get_submission_is_single_query(client, participant_token, admin_token, db_session, query_counter):
+    # Автор, конференція і ролі не вантажаться, поки їх явно не попросили
+    sub_id = create_submission(client, participant_token, admin_token)
+
+    query_counter["count"] = 0
+    submission = submission_service.get_submission(db_session, uuid.UUID(sub_id))
+    assert submission.authors
+    assert query_counter["count"] == 1
@@ -0,0 +1,70 @@
+import io
+from collections import OrderedDict
+
+import pytest
+from docx import Document
+
+from app.services.thesis_validation import validator
+
+
+def make_docx() -> bytes:
+    doc = Document()
+    doc.add_paragraph("ТЕЗИ ДОПОВІДІ")
+    doc.add_paragraph("Текст тез без списку літератури.")
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    # Порожній кэш на тест і лічильник реальних перевірок документа
+    monkeypatch.setattr(validator, "_report_cache", OrderedDict())
+    calls = {"count": 0}
+    original = validator._validate_document
+
+    def counting(doc, rules):
+        calls["count"] += 1
+        return original(doc, rules)
+
+    monkeypatch.setattr(validator, "_validate_document", counting)
+    return calls
+
+
+def test_same_bytes_are_validated_once(parse_counter):
+    data = make_docx()
+
+    first = validator.validate_thesis_docx(io.BytesIO(data))
+    second = validator.validate_thesis_docx(io.BytesIO(data))
+
+    assert parse_counter["count"] == 1
+    assert first.to_dict() == second.to_dict()
+
+
+def test_cached_report_is_independent_copy(parse_counter):
+    data = make_docx()
+
+    first = validator.validate_thesis_docx(io.BytesIO(data))
+    expected = first.to_dict()
+    assert first.issues
+
+    # Зміни в отриманому звіті не повинні потрапити в кэш
+    first.issues[0].message = "changed"
+    first.issues[0].details = {"changed": True}
+    first.issues.clear()
+
+    second = validator.validate_thesis_docx(io.BytesIO(data))
+    assert parse_counter["count"] == 1
+    assert second.to_dict() == expected
+
+
+def test_fileobj_variant_shares_cache(parse_counter):
+    data = make_docx()
+    hasher = validator.content_hasher()
+    hasher.update(data)
+
+    validator.validate_thesis_docx(io.BytesIO(data))
+    report = validator.validate_thesis_docx_from_fileobj(io.BytesIO(data), hasher.hexdigest())
+
+    assert parse_counter["count"] == 1
+    assert report.issues